@@ -0,0 +1,9 @@
+__all__ = ["Client"]
+
+
+def __getattr__(name):
+    if name == "Client":
+        from klient.client import Client
+
+        return Client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
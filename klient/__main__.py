@@ -0,0 +1,4 @@
+from klient.cli import app
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,635 @@
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+from rich.console import Console
+from getpass import getpass
+from functools import lru_cache
+from contextlib import contextmanager
+from operator import itemgetter
+
+import typer
+
+from klient.config import (
+    CONFIG_FILE,
+    LEGACY_KEY_FILE,
+    decrypt_api_key,
+    encrypt_api_key,
+    forget_passphrase,
+    is_legacy_config,
+    is_recently_verified,
+    read_legacy_api_key,
+    remember_verified,
+    write_atomic,
+)
+
+# Heavy modules are imported in the functions that use them, so --help stays fast.
+if TYPE_CHECKING:
+    import requests
+    from concurrent.futures import Future
+    from rich.progress import Progress
+    from rich.table import Table
+
+    from klient.client import Client
+
+app = typer.Typer()
+console = Console()
+# Takes status and error messages when stdout is piped.
+_err_console = Console(stderr=True)
+
+API_KEY_ENVVAR = "KUUICHI_API_KEY"
+PASSPHRASE_ATTEMPTS = 3
+
+_FILE_KEYS = ("file_name", "file_url", "file-size", "file-type", "date-uploaded")
+_FILE_FIELDS = itemgetter(*_FILE_KEYS)
+# Labels for _file_row()'s columns, in the same order.
+_FILE_LABELS = (
+    "File Name",
+    "File URL",
+    "Delete URL",
+    "File Size",
+    "File Type",
+    "Date Uploaded",
+)
+_UPLOAD_FIELDS = itemgetter("file_url", "delete_url", "file-size", "date-uploaded")
+
+
+@app.callback()
+def main(ctx: typer.Context):
+    from klient.client import Client
+
+    ctx.obj = Client()
+    ctx.call_on_close(ctx.obj.close)
+
+
+def messages() -> Console:
+    return console if console.is_terminal else _err_console
+
+
+def die(msg, code: int = 1):
+    messages().print(f"[bold red]Error:[/bold red] {msg}", style="red")
+    raise typer.Exit(code=code)
+
+
+def http_error(response: "requests.Response"):
+    messages().print(
+        f"[bold red]Error {response.status_code}:[/bold red] {response.text}",
+        style="red",
+    )
+    raise typer.Exit(code=1)
+
+
+@contextmanager
+def net():
+    from klient.client import REQUEST_ERRORS
+
+    try:
+        yield
+    except REQUEST_ERRORS as e:
+        die(e)
+
+
+def file_error(file_path: Path, e: OSError) -> str:
+    # Not e.filename: errors from seeking or mapping an open file carry none.
+    if isinstance(e, FileNotFoundError):
+        return f"The file '{file_path}' does not exist."
+    return f"Cannot read '{file_path}': {e.strerror}."
+
+
+def require_api_key(client: "Client", api_key: Optional[str]) -> str:
+    if api_key:
+        return api_key
+    # The stored key needs prompts, so only fall back to it on a terminal.
+    if not sys.stdin.isatty():
+        die("API key is required.")
+    return handle_api_key(client)
+
+
+def verify_api_key(client: "Client", api_key: str) -> bool:
+    import requests
+
+    try:
+        return client.verify(api_key)
+    except requests.exceptions.RequestException as e:
+        messages().print(
+            f"[bold red]Error during API key verification:[/bold red] {e}", style="red"
+        )
+        return False
+
+
+# Only successes are kept; a failure may be a transient network error.
+_verified_keys = set()
+
+
+def _verify_cached(client: "Client", api_key: str) -> bool:
+    if api_key in _verified_keys or is_recently_verified(api_key):
+        _verified_keys.add(api_key)
+        return True
+    ok = verify_api_key(client, api_key)
+    if ok:
+        _verified_keys.add(api_key)
+        remember_verified(api_key)
+    return ok
+
+
+def _decrypt_stored_key() -> str:
+    from cryptography.fernet import InvalidToken
+
+    encrypted_key = CONFIG_FILE.read_bytes()
+    for _ in range(PASSPHRASE_ATTEMPTS):
+        try:
+            return decrypt_api_key(encrypted_key)
+        except InvalidToken:
+            forget_passphrase()
+            messages().print(
+                "[bold red]Error:[/bold red] Wrong passphrase. Please try again."
+            )
+    die(
+        f"Could not decrypt the stored API key. Delete {CONFIG_FILE} to "
+        "enter a new one."
+    )
+
+
+def _stored_api_key(client: "Client") -> Optional[str]:
+    if not CONFIG_FILE.exists():
+        return None
+
+    legacy = is_legacy_config()
+    api_key = read_legacy_api_key() if legacy else _decrypt_stored_key()
+    if api_key is None:
+        messages().print(
+            "[bold red]Error:[/bold red] The stored API key could not be read. "
+            "Please enter a new one."
+        )
+        return None
+    if not _verify_cached(client, api_key):
+        messages().print(
+            "[bold red]Error:[/bold red] Invalid API key. Please enter a new one."
+        )
+        return None
+
+    if legacy:
+        # No KDF params yet, so this asks for a new passphrase.
+        write_atomic(CONFIG_FILE, encrypt_api_key(api_key))
+        LEGACY_KEY_FILE.unlink(missing_ok=True)
+        messages().print("[green]Stored API key re-encrypted.[/green]")
+    return api_key
+
+
+def handle_api_key(client: "Client") -> str:
+    api_key = _stored_api_key(client)
+    if api_key:
+        client.use_api_key(api_key)
+        return api_key
+
+    while True:
+        api_key = getpass("Enter your API key: ")
+        if _verify_cached(client, api_key):
+            write_atomic(CONFIG_FILE, encrypt_api_key(api_key))
+            LEGACY_KEY_FILE.unlink(missing_ok=True)
+            messages().print("[green]API key saved successfully.[/green]")
+            client.use_api_key(api_key)
+            return api_key
+        else:
+            messages().print(
+                "[bold red]Error:[/bold red] Invalid API key. Please try again."
+            )
+
+
+@lru_cache(maxsize=1)
+def _clipboard_copy():
+    import pyperclip
+
+    copy, _ = pyperclip.determine_clipboard()
+    return copy
+
+
+def copy_to_clipboard(text: str) -> bool:
+    import pyperclip
+
+    try:
+        _clipboard_copy()(text)
+    except pyperclip.PyperclipException:
+        messages().print("[yellow]Warning:[/yellow] Could not copy to the clipboard.")
+        return False
+    return True
+
+
+def upload_progress() -> "Progress":
+    from rich.progress import BarColumn, DownloadColumn, Progress, TransferSpeedColumn
+
+    return Progress(
+        "{task.description}",
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        console=messages(),
+        transient=True,
+    )
+
+
+def post_file(
+    client: "Client", file_path: Path, progress: "Progress"
+) -> "requests.Response":
+    task = progress.add_task(file_path.name, total=None)
+    return client.upload(
+        file_path,
+        lambda read, total: progress.update(task, completed=read, total=total),
+    )
+
+
+def upload_file(client: "Client", file_path: Path, api_key: str, clipboard: bool):
+    from klient.client import decode_json, get_mime_type
+
+    # /upload authenticates the key itself, so no /verify round-trip.
+    client.use_api_key(api_key)
+
+    # net() sits inside the try because requests' errors are OSErrors too.
+    try:
+        with net(), upload_progress() as progress:
+            response = post_file(client, file_path, progress)
+    except OSError as e:
+        die(file_error(file_path, e))
+
+    with net():
+        if response.status_code == 200:
+            data = decode_json(response)
+            file_mimetype = get_mime_type(file_path)
+            display_success(data, file_mimetype)
+            if clipboard and copy_to_clipboard(data["file_url"]):
+                messages().print("[blue]URL copied to clipboard![/blue]")
+        elif response.status_code in (401, 403):
+            die("Invalid API key.")
+        else:
+            http_error(response)
+
+
+def upload_files(
+    client: "Client", file_paths: List[Path], api_key: str, clipboard: bool
+):
+    client.use_api_key(api_key)
+
+    with upload_progress() as progress:
+        tasks = [
+            progress.add_task(file_path.name, total=None) for file_path in file_paths
+        ]
+        futures = client.upload_many(
+            file_paths,
+            lambda index, read, total: progress.update(
+                tasks[index], completed=read, total=total
+            ),
+        )
+
+    results = collect_results(file_paths, futures)
+    display_uploads(results)
+    urls = [data["file_url"] for _, data, _ in results if data]
+    if urls and clipboard and copy_to_clipboard("\n".join(urls)):
+        messages().print("[blue]URLs copied to clipboard![/blue]")
+    if len(urls) < len(results):
+        raise typer.Exit(code=1)
+
+
+def collect_results(keys, futures: List["Future"]):
+    from klient.client import REQUEST_ERRORS, decode_json
+
+    # One failure doesn't abort the rest of the batch.
+    results = []
+    for key, future in zip(keys, futures):
+        try:
+            response = future.result()
+            if response.status_code == 200:
+                results.append((key, decode_json(response), None))
+            elif response.status_code in (401, 403):
+                results.append((key, None, "Invalid API key."))
+            else:
+                results.append(
+                    (key, None, f"Error {response.status_code}: {response.text}")
+                )
+        except REQUEST_ERRORS as e:
+            results.append((key, None, str(e)))
+        # After REQUEST_ERRORS: requests' exceptions subclass OSError.
+        except OSError as e:
+            results.append((key, None, file_error(key, e)))
+    return results
+
+
+def _details_table(title: str) -> "Table":
+    from rich.table import Table
+
+    table = Table(title=title)
+    table.add_column("Attribute", style="cyan", no_wrap=True)
+    table.add_column("Details", style="magenta")
+    return table
+
+
+def _uploads_table() -> "Table":
+    from rich.table import Table
+
+    table = Table(title="[green]File Uploads[/green]")
+    table.add_column("File Name", style="cyan", no_wrap=True)
+    table.add_column("File URL", style="magenta")
+    table.add_column("Delete URL", style="red")
+    table.add_column("File Size", style="green")
+    table.add_column("File Type", style="blue")
+    return table
+
+
+def _files_table(title: str = "[green]User Files[/green]") -> "Table":
+    from rich.table import Table
+
+    table = Table(title=title)
+    table.add_column("File Name", style="cyan", no_wrap=True)
+    table.add_column("File URL", style="magenta")
+    table.add_column("Delete URL", style="red")
+    table.add_column("File Size", style="green")
+    table.add_column("File Type", style="blue")
+    table.add_column("Date Uploaded", style="yellow")
+    return table
+
+
+def _write_rows(rows):
+    sys.stdout.write("".join("\t".join(map(str, row)) + "\n" for row in rows))
+
+
+def _write_results(results, row):
+    _write_rows(row(key, data) for key, data, _ in results if data)
+    for key, _, error in results:
+        if error:
+            messages().print(f"[bold red]Error:[/bold red] {key}: {error}", style="red")
+
+
+def _search_table() -> "Table":
+    from rich.table import Table
+
+    table = Table(title="[green]Search Results[/green]")
+    table.add_column("File Name", style="cyan", no_wrap=True)
+    table.add_column("File URL", style="magenta")
+    table.add_column("Score (%)", style="yellow")
+    return table
+
+
+def display_success(data, file_type):
+    file_url, delete_url, file_size, date_uploaded = _UPLOAD_FIELDS(data)
+    if not console.is_terminal:
+        _write_rows([(file_url, delete_url, file_size, file_type, date_uploaded)])
+        return
+
+    table = _details_table("[green]File Upload Successful![/green]")
+    table.add_row("File URL", file_url)
+    table.add_row("Delete URL", delete_url)
+    table.add_row("File Size", file_size)
+    table.add_row("File Type", file_type)
+    table.add_row("Date Uploaded", date_uploaded)
+    console.print(table)
+
+
+def display_uploads(results):
+    from klient.client import get_mime_type
+
+    def row(file_path, data):
+        file_url, delete_url, file_size, _ = _UPLOAD_FIELDS(data)
+        return (
+            file_path.name,
+            file_url,
+            delete_url,
+            file_size,
+            get_mime_type(file_path),
+        )
+
+    if not console.is_terminal:
+        _write_results(results, row)
+        return
+
+    table = _uploads_table()
+
+    for file_path, data, error in results:
+        if data:
+            table.add_row(*row(file_path, data))
+        else:
+            table.add_row(file_path.name, f"[bold red]{error}[/bold red]")
+
+    console.print(table)
+
+
+@app.command(help="Upload one or more files to the API")
+def upload(
+    ctx: typer.Context,
+    file_paths: List[Path] = typer.Argument(
+        ..., help="Paths to the files you want to upload"
+    ),
+    api_key: Optional[str] = typer.Option(
+        None, help="Your API key", envvar=API_KEY_ENVVAR
+    ),
+    clipboard: bool = typer.Option(
+        True, help="Copy the uploaded file URLs to the clipboard"
+    ),
+):
+    api_key = require_api_key(ctx.obj, api_key)
+    if len(file_paths) == 1:
+        messages().print("[blue]Uploading file...[/blue]")
+        upload_file(ctx.obj, file_paths[0], api_key, clipboard)
+    else:
+        messages().print(f"[blue]Uploading {len(file_paths)} files...[/blue]")
+        upload_files(ctx.obj, file_paths, api_key, clipboard)
+
+
+@app.command(help="List all files you've uploaded with basic info")
+def list_files(
+    ctx: typer.Context,
+    api_key: Optional[str] = typer.Option(
+        None, help="Your API key", envvar=API_KEY_ENVVAR
+    ),
+):
+    api_key = require_api_key(ctx.obj, api_key)
+
+    from klient.client import decode_json
+
+    client: "Client" = ctx.obj
+    client.use_api_key(api_key)
+
+    with net():
+        response = client.list_files()
+        if response.status_code == 200:
+            files_data = decode_json(response).get("files", [])
+            if not files_data:
+                messages().print("[yellow]No files found for the user.[/yellow]")
+            else:
+                display_files(files_data)
+        else:
+            http_error(response)
+
+
+def _file_row(file):
+    # Missing fields show as N/A.
+    try:
+        fields = _FILE_FIELDS(file)
+    except KeyError:
+        fields = [file.get(key, "N/A") for key in _FILE_KEYS]
+    file_name, file_url, file_size, file_type, date_uploaded = fields
+    delete_url = file.get("delete_url", "N/A")
+    return file_name, file_url, delete_url, file_size, file_type, date_uploaded
+
+
+def display_files(files_data):
+    if not console.is_terminal:
+        _write_rows(map(_file_row, files_data))
+        return
+
+    table = _files_table()
+
+    for file in files_data:
+        table.add_row(*_file_row(file))
+
+    console.print(table)
+
+
+@app.command(help="Search for files using a fuzzy match on the filename.")
+def search(
+    ctx: typer.Context,
+    query: str,
+    api_key: Optional[str] = typer.Option(
+        None, help="Your API key", envvar=API_KEY_ENVVAR
+    ),
+    limit: int = 5,
+):
+    api_key = require_api_key(ctx.obj, api_key)
+
+    from klient.client import decode_json
+
+    client: "Client" = ctx.obj
+    client.use_api_key(api_key)
+
+    with net():
+        response = client.search(query, limit)
+        if response.status_code == 200:
+            results = decode_json(response).get("results", [])
+            if results:
+                display_search_results(results)
+            else:
+                messages().print("[yellow]No matching files found.[/yellow]")
+        else:
+            http_error(response)
+
+
+def display_search_results(results):
+    if not console.is_terminal:
+        _write_rows(
+            (result["file_name"], result["file_url"], int(result["score"]))
+            for result in results
+        )
+        return
+
+    table = _search_table()
+
+    rows = [
+        (result["file_name"], result["file_url"], f"{int(result['score'])}%")
+        for result in results
+    ]
+    for row in rows:
+        table.add_row(*row)
+
+    console.print(table)
+
+
+@app.command(help="Get stats about the API")
+def info(ctx: typer.Context):
+    from klient.client import decode_json
+
+    client: "Client" = ctx.obj
+
+    with net():
+        response = client.info()
+        if response.status_code == 200:
+            data = decode_json(response)
+            rows = [
+                ("Total Storage Used", data.get("storage_used", "N/A")),
+                ("Total Uploads", str(data.get("uploads", "N/A"))),
+                ("Total Users", str(data.get("users", "N/A"))),
+            ]
+            if not console.is_terminal:
+                _write_rows(rows)
+                return
+
+            from rich.table import Table
+
+            table = Table(title="[green]Server Information[/green]")
+            table.add_column("Metric", style="cyan", no_wrap=True)
+            table.add_column("Value", style="magenta")
+            for row in rows:
+                table.add_row(*row)
+            console.print(table)
+        else:
+            http_error(response)
+
+
+def display_analytics(data):
+    from rich.table import Table
+
+    table = Table(title="[green]Analytics[/green]")
+    table.add_column("Metric", style="cyan", no_wrap=True)
+    table.add_column("Value", style="magenta")
+    table.add_row(
+        "File Types", ", ".join(f"{k}: {v}" for k, v in data["file_types"].items())
+    )
+    table.add_row(
+        "User Uploads", ", ".join(f"{k}: {v}" for k, v in data["user_uploads"].items())
+    )
+    console.print(table)
+
+
+def display_file_info(data):
+    if not console.is_terminal:
+        _write_rows([_file_row(data)])
+        return
+
+    table = _details_table("[green]File Information[/green]")
+    for label, value in zip(_FILE_LABELS, _file_row(data)):
+        table.add_row(label, value)
+    console.print(table)
+
+
+@app.command(help="Show details for one or more of your uploaded files")
+def file_info(
+    ctx: typer.Context,
+    file_names: List[str] = typer.Argument(..., help="Names of the files to look up"),
+    api_key: Optional[str] = typer.Option(
+        None, help="Your API key", envvar=API_KEY_ENVVAR
+    ),
+):
+    api_key = require_api_key(ctx.obj, api_key)
+
+    from klient.client import decode_json
+
+    client: "Client" = ctx.obj
+    client.use_api_key(api_key)
+
+    if len(file_names) == 1:
+        with net():
+            response = client.file_info(file_names[0])
+            if response.status_code == 200:
+                display_file_info(decode_json(response))
+            elif response.status_code in (401, 403):
+                die("Invalid API key.")
+            else:
+                http_error(response)
+        return
+
+    results = collect_results(file_names, client.file_info_many(file_names))
+    display_file_infos(results)
+    if any(error for _, _, error in results):
+        raise typer.Exit(code=1)
+
+
+def display_file_infos(results):
+    if not console.is_terminal:
+        _write_results(results, lambda _, data: _file_row(data))
+        return
+
+    table = _files_table("[green]File Information[/green]")
+
+    for file_name, data, error in results:
+        if data:
+            table.add_row(*_file_row(data))
+        else:
+            table.add_row(file_name, f"[bold red]{error}[/bold red]")
+
+    console.print(table)
@@ -0,0 +1,205 @@
+from pathlib import Path
+from typing import Callable, List, Optional
+from contextlib import ExitStack
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import orjson
+import requests
+import mimetypes
+import mmap
+import os
+import stat
+import uuid
+
+BASE_URL = "https://kuuichi.xyz"
+# Below this, mmap setup costs more than the copy it saves.
+MMAP_THRESHOLD = 1 << 20
+# Batch concurrency, and the connection pool size to match.
+MAX_WORKERS = 8
+# requests has no default timeout.
+REQUEST_TIMEOUT = 30.0
+# urllib3's 16 KiB default means thousands of reads per large upload.
+UPLOAD_BLOCKSIZE = 1 << 20
+# Only has to be absent from the bodies, so one per process will do.
+BOUNDARY = uuid.uuid4().hex
+
+REQUEST_ERRORS = (requests.exceptions.RequestException, orjson.JSONDecodeError)
+
+_ENCODING_TYPES = {
+    "gzip": "application/gzip",
+    "bzip2": "application/x-bzip2",
+    "xz": "application/x-xz",
+    "compress": "application/x-compress",
+}
+
+
+def decode_json(response: requests.Response):
+    return orjson.loads(response.content)
+
+
+def _suffix_key(file_path: Path) -> str:
+    # Two suffixes so the displayed type of a .tar.gz is still "x-tar".
+    return "".join(file_path.suffixes[-2:]).lower()
+
+
+def get_mime_type(file_path: Path) -> str:
+    return _mime_for_suffix(_suffix_key(file_path))
+
+
+def get_content_type(file_path: Path) -> str:
+    return _content_type_for_suffix(file_path.suffix.lower())
+
+
+@lru_cache(maxsize=256)
+def _content_type_for_suffix(suffix: str) -> str:
+    mime_type, encoding = mimetypes.guess_type("x" + suffix)
+    # A compressed file is sent as the archive it is, not as its contents.
+    if encoding:
+        return _ENCODING_TYPES.get(encoding, "application/octet-stream")
+    return mime_type or "application/octet-stream"
+
+
+@lru_cache(maxsize=256)
+def _mime_for_suffix(suffix: str) -> str:
+    mime_type, _ = mimetypes.guess_type("x" + suffix)
+    return mime_type.rpartition("/")[2] if mime_type else "unknown"
+
+
+class _Adapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("blocksize", UPLOAD_BLOCKSIZE)
+        super().init_poolmanager(*args, **kwargs)
+
+
+class Client:
+    __slots__ = ("base_url", "session", "api_key")
+
+    def __init__(self, base_url: Optional[str] = None):
+        self.base_url = base_url or BASE_URL
+        self.api_key: Optional[str] = None
+        # One pooled session so calls reuse the keep-alive connection.
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            _Adapter(
+                pool_connections=4,
+                pool_maxsize=MAX_WORKERS,
+                max_retries=Retry(
+                    total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+                ),
+            ),
+        )
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def use_api_key(self, api_key: str):
+        if api_key == self.api_key:
+            return
+        self.api_key = api_key
+        self.session.headers["Authorization"] = api_key
+
+    def verify(self, api_key: str) -> bool:
+        response = self.session.post(
+            f"{self.base_url}/verify",
+            headers={"Authorization": api_key},
+            timeout=REQUEST_TIMEOUT,
+        )
+        return response.status_code == 200
+
+    def upload(
+        self,
+        file_path: Path,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> requests.Response:
+        from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+        from requests_toolbelt.multipart.encoder import FileWrapper
+
+        with open(file_path, "rb") as f, ExitStack() as stack:
+            st = os.fstat(f.fileno())
+            # Pipes and other non-regular files reject both hints.
+            regular = stat.S_ISREG(st.st_mode)
+            if regular and hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            body = f
+            if regular and st.st_size > MMAP_THRESHOLD:
+                mapped = stack.enter_context(
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                )
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                # mmap has no fileno(); FileWrapper lets the encoder track its length.
+                body = FileWrapper(mapped)
+            encoder = MultipartEncoder(
+                fields={"file": (file_path.name, body, get_content_type(file_path))},
+                boundary=BOUNDARY,
+            )
+            data = encoder
+            if on_progress:
+                data = MultipartEncoderMonitor(
+                    encoder, lambda m: on_progress(m.bytes_read, m.len)
+                )
+            return self.session.post(
+                f"{self.base_url}/upload",
+                data=data,
+                headers={"Content-Type": encoder.content_type},
+                timeout=REQUEST_TIMEOUT,
+            )
+
+    def upload_many(
+        self,
+        file_paths: List[Path],
+        on_progress: Optional[Callable[[int, int, int], None]] = None,
+    ) -> List[Future]:
+        def upload_one(index: int, file_path: Path) -> requests.Response:
+            if on_progress is None:
+                return self.upload(file_path)
+            return self.upload(
+                file_path, lambda read, total: on_progress(index, read, total)
+            )
+
+        # Load the mimetypes database here rather than racing in the workers.
+        for file_path in file_paths:
+            get_content_type(file_path)
+
+        return self._map(upload_one, range(len(file_paths)), file_paths)
+
+    def list_files(self) -> requests.Response:
+        return self.session.get(f"{self.base_url}/files", timeout=REQUEST_TIMEOUT)
+
+    def search(self, query: str, limit: int = 5) -> requests.Response:
+        return self.session.get(
+            f"{self.base_url}/search",
+            params={"query": query, "limit": limit},
+            timeout=REQUEST_TIMEOUT,
+        )
+
+    def info(self) -> requests.Response:
+        return self.session.get(f"{self.base_url}/info", timeout=REQUEST_TIMEOUT)
+
+    def file_info(self, file_name: str) -> requests.Response:
+        return self.session.get(
+            f"{self.base_url}/file_info",
+            params={"filename": file_name},
+            timeout=REQUEST_TIMEOUT,
+        )
+
+    def file_info_many(self, file_names: List[str]) -> List[Future]:
+        return self._map(self.file_info, file_names)
+
+    def _map(self, fn: Callable, *iterables) -> List[Future]:
+        # The futures come back done, in input order.
+        calls = list(zip(*iterables))
+        workers = min(MAX_WORKERS, len(calls)) or 1
+        with ThreadPoolExecutor(workers) as executor:
+            return [executor.submit(fn, *args) for args in calls]
@@ -0,0 +1,154 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+from getpass import getpass
+from functools import lru_cache
+
+import hashlib
+import hmac
+import time
+import base64
+import os
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+CONFIG_FILE = Path.home() / ".config/klu.conf"
+KDF_PARAMS_FILE = Path.home() / ".config/klu_kdf.json"
+LEGACY_KEY_FILE = Path.home() / ".config/klu_key.key"
+KDF_ITERATIONS = 600_000
+VERIFY_CACHE_FILE = Path.home() / ".config/klu_verify.cache"
+VERIFY_CACHE_TTL = 300
+
+
+def write_atomic(path: Path, data: bytes):
+    # Rename over the target so a crash never leaves a truncated file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def generate_kdf_params() -> dict:
+    import orjson
+
+    params = {
+        "salt": base64.b64encode(os.urandom(16)).decode(),
+        "iterations": KDF_ITERATIONS,
+    }
+    write_atomic(KDF_PARAMS_FILE, orjson.dumps(params))
+    return params
+
+
+@lru_cache(maxsize=1)
+def load_kdf_params() -> dict:
+    import orjson
+
+    if not KDF_PARAMS_FILE.exists():
+        return generate_kdf_params()
+    return orjson.loads(KDF_PARAMS_FILE.read_bytes())
+
+
+def _new_passphrase() -> str:
+    # A typo here would lock the key away, so ask twice.
+    while True:
+        passphrase = getpass("Choose a passphrase: ")
+        if getpass("Confirm your passphrase: ") == passphrase:
+            return passphrase
+        print("Passphrases do not match. Please try again.")
+
+
+@lru_cache(maxsize=1)
+def _fernet() -> "Fernet":
+    from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    # Checked before load_kdf_params() creates the params for a new setup.
+    existing = CONFIG_FILE.exists() and not is_legacy_config()
+    params = load_kdf_params()
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=base64.b64decode(params["salt"]),
+        iterations=params["iterations"],
+    )
+    if existing:
+        passphrase = getpass("Enter your passphrase: ")
+    else:
+        passphrase = _new_passphrase()
+    return Fernet(base64.urlsafe_b64encode(kdf.derive(passphrase.encode())))
+
+
+def forget_passphrase():
+    _fernet.cache_clear()
+
+
+def is_legacy_config() -> bool:
+    # Written before passphrases: encrypted with klu_key.key, no KDF params.
+    return CONFIG_FILE.exists() and not KDF_PARAMS_FILE.exists()
+
+
+def read_legacy_api_key() -> Optional[str]:
+    from cryptography.fernet import Fernet, InvalidToken
+
+    try:
+        fernet = Fernet(LEGACY_KEY_FILE.read_bytes())
+        return fernet.decrypt(CONFIG_FILE.read_bytes()).decode()
+    except (OSError, ValueError, InvalidToken):
+        return None
+
+
+def encrypt_api_key(api_key: str) -> bytes:
+    encrypted_key = _fernet().encrypt(api_key.encode())
+    return encrypted_key
+
+
+def decrypt_api_key(encrypted_key: bytes) -> str:
+    decrypted_key = _fernet().decrypt(encrypted_key).decode()
+    return decrypted_key
+
+
+def _verify_digest(api_key: str) -> Optional[str]:
+    # Keyed with the KDF salt, which doesn't exist until a passphrase is set.
+    if not KDF_PARAMS_FILE.exists():
+        return None
+    salt = base64.b64decode(load_kdf_params()["salt"])
+    return hmac.new(salt, api_key.encode(), hashlib.sha256).hexdigest()
+
+
+def _read_verify_cache() -> dict:
+    import orjson
+
+    try:
+        return orjson.loads(VERIFY_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def _fresh_verify_cache() -> dict:
+    now = time.time()
+    return {
+        key: entry
+        for key, entry in _read_verify_cache().items()
+        if now - entry[0] < VERIFY_CACHE_TTL
+    }
+
+
+# Successful verifications are remembered for VERIFY_CACHE_TTL seconds.
+def is_recently_verified(api_key: str) -> bool:
+    digest = _verify_digest(api_key)
+    return digest is not None and digest in _fresh_verify_cache()
+
+
+def remember_verified(api_key: str):
+    import orjson
+
+    digest = _verify_digest(api_key)
+    if digest is None:
+        return
+    cache = _fresh_verify_cache()
+    cache[digest] = (time.time(), True)
+    try:
+        write_atomic(VERIFY_CACHE_FILE, orjson.dumps(cache))
+    except OSError:
+        pass